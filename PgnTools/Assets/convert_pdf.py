@@ -1,31 +1,100 @@
+import multiprocessing
 import os
+import sys
 import time
 import logging
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from docling.document_converter import DocumentConverter, PdfFormatOption
 from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode
+from docling.datamodel.accelerator_options import AcceleratorDevice, AcceleratorOptions
+from docling.datamodel.pipeline_options import ThreadedPdfPipelineOptions, TableFormerMode
+from docling.pipeline.threaded_standard_pdf_pipeline import ThreadedStandardPdfPipeline
+from docling.utils.accelerator_utils import decide_device
 
 # --- CONFIGURATION ---
 SOURCE_DIR = "pdf"      # Folder containing your downloaded Microsoft PDFs
 OUTPUT_DIR = "md_source" # Folder where clean Markdown will go
+MAX_WORKERS = min(4, os.cpu_count() or 1) # CPU-only cap; each worker loads its own Docling models, raise this if RAM allows
 # ---------------------
 
-def setup_converter():
+# One converter per process; DocumentConverter is too heavy to pickle across processes.
+_CONVERTER = None
+
+def setup_converter(num_threads: int):
     """
     Configures Docling to be aggressive about table detection and 
     code block preservation, which is critical for .NET reference docs.
+    num_threads is this process's share of the CPU.
     """
-    pipeline_options = PdfPipelineOptions(do_table_structure=True)
+    # The threaded pipeline overlaps OCR/layout/table stages with bounded queues
+    # and runs inference on CUDA/MPS when available.
+    pipeline_options = ThreadedPdfPipelineOptions(
+        do_table_structure=True,
+        accelerator_options=AcceleratorOptions(device=AcceleratorDevice.AUTO, num_threads=num_threads),
+        ocr_batch_size=4,
+        layout_batch_size=64,
+        table_batch_size=4,
+    )
     # 'ACCURATE' mode is slower but essential for complex property tables in WinUI docs
     pipeline_options.table_structure_options.mode = TableFormerMode.ACCURATE 
 
     return DocumentConverter(
         format_options={
-            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+            InputFormat.PDF: PdfFormatOption(
+                pipeline_cls=ThreadedStandardPdfPipeline,
+                pipeline_options=pipeline_options,
+            )
         }
     )
 
+def _uses_gpu():
+    """True when Docling's AUTO device resolves to CUDA or MPS rather than the CPU."""
+    return decide_device(AcceleratorDevice.AUTO.value).startswith(("cuda", "mps"))
+
+def _init_worker(num_threads: int):
+    """Builds the converter and loads its models once when a worker process starts."""
+    global _CONVERTER
+    _CONVERTER = setup_converter(num_threads)
+    _CONVERTER.initialize_pipeline(InputFormat.PDF)
+
+def convert_one(pdf_file: Path, source_path: Path, output_path: Path):
+    """
+    Converts a single PDF to Markdown, in a worker process or in-process on the GPU.
+    Returns (pdf_file, elapsed_seconds, error_message).
+    """
+    global _CONVERTER
+    if _CONVERTER is None:
+        _init_worker(os.cpu_count() or 1)
+
+    start_time = time.time()
+    try:
+        # The Heavy Lifting
+        result = _CONVERTER.convert(pdf_file)
+        markdown_content = result.document.export_to_markdown()
+
+        # We mirror the filename but change extension to .md
+        relative_path = pdf_file.relative_to(source_path)
+        dest_file = output_path / relative_path.with_suffix(".md")
+
+        # Ensure subdirectories exist in output
+        dest_file.parent.mkdir(parents=True, exist_ok=True)
+
+        with open(dest_file, "w", encoding="utf-8") as f:
+            f.write(f"\n\n")
+            f.write(markdown_content)
+
+        return pdf_file, time.time() - start_time, None
+
+    except Exception as e:
+        return pdf_file, time.time() - start_time, str(e)
+
+def _log_result(logger, index, total, pdf_file, elapsed, error):
+    if error:
+        logger.error(f"❌ [{index}/{total}] FAILED {pdf_file.name}: {error}")
+    else:
+        logger.info(f"✓ [{index}/{total}] Finished {pdf_file.name} in {elapsed:.2f}s")
+
 def batch_convert():
     # 1. Setup
     logging.basicConfig(level=logging.INFO)
@@ -35,39 +104,53 @@ def batch_convert():
     output_path = Path(OUTPUT_DIR)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    converter = setup_converter()
-    
     # 2. Find all PDFs (recursively)
     pdf_files = list(source_path.rglob("*.pdf"))
     logger.info(f"Found {len(pdf_files)} PDF files to process.")
+    if not pdf_files:
+        return
+
+    # 3a. GPU: convert in this process. The threaded pipeline already keeps the GPU busy,
+    # extra workers would only load duplicate models, and CUDA is already initialized here.
+    if _uses_gpu():
+        logger.info("Converting in-process on the GPU...")
+        _init_worker(os.cpu_count() or 1)
+        for i, pdf_file in enumerate(pdf_files, 1):
+            _, elapsed, error = convert_one(pdf_file, source_path, output_path)
+            _log_result(logger, i, len(pdf_files), pdf_file, elapsed, error)
+        return
+
+    # 3b. CPU: fan out one PDF per task; log completions as they arrive
+    workers = max(1, min(MAX_WORKERS, len(pdf_files)))
+    if sys.platform == "win32":
+        # ProcessPoolExecutor raises ValueError above 61 workers on Windows
+        workers = min(workers, 61)
+
+    # Split the cores between workers so their inference threads don't oversubscribe the CPU
+    num_threads = max(1, (os.cpu_count() or 1) // workers)
+    logger.info(f"Converting with {workers} worker process(es), {num_threads} thread(s) each...")
+
+    # Spawn rather than fork: the device probe above has already imported torch in this process.
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(num_threads,),
+    ) as executor:
+        futures = [
+            executor.submit(convert_one, pdf_file, source_path, output_path)
+            for pdf_file in pdf_files
+        ]
+
+        for i, future in enumerate(as_completed(futures), 1):
+            try:
+                pdf_file, elapsed, error = future.result()
+            except Exception as e:
+                # A worker died (e.g. out of memory) before it could report back
+                logger.error(f"❌ [{i}/{len(pdf_files)}] Worker failed: {e}")
+                continue
 
-    # 3. Process Loop
-    for i, pdf_file in enumerate(pdf_files, 1):
-        try:
-            logger.info(f"[{i}/{len(pdf_files)}] Converting: {pdf_file.name}...")
-            start_time = time.time()
-            
-            # The Heavy Lifting
-            result = converter.convert(pdf_file)
-            markdown_content = result.document.export_to_markdown()
-
-            # 4. Save to Markdown
-            # We mirror the filename but change extension to .md
-            relative_path = pdf_file.relative_to(source_path)
-            dest_file = output_path / relative_path.with_suffix(".md")
-            
-            # Ensure subdirectories exist in output
-            dest_file.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(dest_file, "w", encoding="utf-8") as f:
-                f.write(f"\n\n")
-                f.write(markdown_content)
-
-            elapsed = time.time() - start_time
-            logger.info(f"✓ Finished {pdf_file.name} in {elapsed:.2f}s")
-
-        except Exception as e:
-            logger.error(f"❌ FAILED {pdf_file.name}: {e}")
+            _log_result(logger, i, len(pdf_files), pdf_file, elapsed, error)
 
 if __name__ == "__main__":
-    batch_convert()
\ No newline at end of file
+    batch_convert()
@@ -1,3 +1,4 @@
+using System.Buffers;
 using System.Globalization;
 using System.Net;
 using System.Text;
@@ -75,6 +76,7 @@ public sealed class ChesscomEventsDownloaderService : IChesscomEventsDownloaderS
     };
 
     private static readonly HttpClient HttpClient = CreateClient();
+    private static readonly SearchValues<char> CsvSpecialChars = SearchValues.Create(",\"\r\n");
 
     public async Task<ChesscomEventsDownloadResult> DownloadEventsAsync(
         ChesscomEventsDownloadOptions options,
@@ -673,12 +675,10 @@ public sealed class ChesscomEventsDownloaderService : IChesscomEventsDownloaderS
     private static int CountGames(string pgn)
     {
         var count = 0;
-        using var reader = new StringReader(pgn);
-        string? line;
 
-        while ((line = reader.ReadLine()) != null)
+        foreach (var line in pgn.AsSpan().EnumerateLines())
         {
-        if (line.StartsWith("[Event ", StringComparison.OrdinalIgnoreCase))
+            if (line.StartsWith("[Event ", StringComparison.OrdinalIgnoreCase))
             {
                 count++;
             }
@@ -1131,7 +1131,7 @@ public sealed class ChesscomEventsDownloaderService : IChesscomEventsDownloaderS
 
     private static string EscapeCsv(string value)
     {
-        if (value.IndexOfAny(new[] { ',', '"', '\r', '\n' }) < 0)
+        if (value.AsSpan().IndexOfAny(CsvSpecialChars) < 0)
         {
             return value;
         }
@@ -55,9 +55,17 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
     private const int FailedPageLimit = 3;
     private const int EmptyPageLimit = 2;
     private const int MaxScrapePages = 5000;
+    private const int MaxConcurrentMatches = 4;
     private static readonly Uri MatchesBaseUri = new("https://training.lczero.org/matches/");
     private static readonly Uri StorageBaseUri = new("https://storage.lczero.org/files/match_pgns/");
-    private static readonly HttpClient HttpClient = CreateClient();
+    private static readonly TimeSpan ProgressTimeInterval = TimeSpan.FromMilliseconds(200);
+    // Storage archives must arrive as raw bytes, so only the match-list scrape asks for
+    // compressed responses.
+    private static readonly HttpClient PageHttpClient = CreateClient(
+        DecompressionMethods.GZip | DecompressionMethods.Deflate | DecompressionMethods.Brotli);
+    private static readonly HttpClient HttpClient = CreateClient(DecompressionMethods.None);
+    private static readonly string MatchCacheDirectory = Path.Combine(Path.GetTempPath(), "PgnTools", "lc0-matches");
+    private static readonly TimeSpan MatchCacheMaxAge = TimeSpan.FromDays(2);
 
     private static readonly string[] MatchDateFormats =
     [
@@ -80,6 +88,10 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
     private readonly PgnReader _pgnReader;
     private readonly PgnWriter _pgnWriter;
 
+    // URL pattern that last produced games; tried first for later matches so the
+    // known-bad patterns are not re-probed for every match.
+    private int _preferredUrlPattern = -1;
+
     public Lc0DownloaderService(PgnReader pgnReader, PgnWriter pgnWriter)
     {
         _pgnReader = pgnReader;
@@ -128,6 +140,9 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
 
         allMatches.Sort((a, b) => a.Date.CompareTo(b.Date));
 
+        // Match files left behind by an interrupted run are reused instead of re-downloaded.
+        var cachedFiles = LoadMatchCache();
+
         var processedMatches = 0;
         var failedMatches = 0;
         long gamesSeen = 0;
@@ -148,53 +163,115 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
                 FileOptions.Asynchronous))
             {
                 using var writer = new StreamWriter(outputStream, new UTF8Encoding(false), BufferSize, leaveOpen: true);
-                var outputWriter = new OutputWriter(writer);
+                var wroteGames = false;
+                var lastProgressReport = DateTime.MinValue;
 
-                for (var i = 0; i < allMatches.Count; i++)
-                {
-                    ct.ThrowIfCancellationRequested();
+                // Up to MaxConcurrentMatches matches download and parse in parallel, each into its
+                // own temp PGN; results are appended in date order as the oldest one completes.
+                using var windowCts = CancellationTokenSource.CreateLinkedTokenSource(ct);
+                var window = new Queue<PendingMatch>();
+                var nextToStart = 0;
 
-                    var match = allMatches[i];
-                    var percent = (i / (double)totalMatches) * 100.0;
-                    progress.Report(new Lc0DownloadProgress(
-                        Lc0DownloadPhase.Downloading,
-                        $"Downloading match {match.MatchId} ({i + 1}/{totalMatches})...",
-                        i + 1,
-                        totalMatches,
-                        percent));
-
-                    var outcome = await DownloadAndProcessMatchAsync(
-                        match,
-                        outputWriter,
-                        options.ExcludeNonStandard,
-                        options.OnlyCheckmates,
-                        ct).ConfigureAwait(false);
-
-                    gamesSeen += outcome.GamesSeen;
-                    gamesKept += outcome.GamesKept;
-
-                    if (outcome.Success)
-                    {
-                        processedMatches++;
-                    }
-                    else
+                try
+                {
+                    for (var i = 0; i < allMatches.Count; i++)
                     {
-                        failedMatches++;
-                        if (!string.IsNullOrWhiteSpace(outcome.Message))
+                        ct.ThrowIfCancellationRequested();
+
+                        while (nextToStart < allMatches.Count && window.Count < MaxConcurrentMatches)
+                        {
+                            if (nextToStart > 0)
+                            {
+                                var delayMs = Random.Shared.Next(200, 450);
+                                await Task.Delay(delayMs, ct).ConfigureAwait(false);
+                            }
+
+                            window.Enqueue(StartMatch(
+                                allMatches[nextToStart++],
+                                cachedFiles,
+                                options.ExcludeNonStandard,
+                                options.OnlyCheckmates,
+                                windowCts.Token));
+                        }
+
+                        var pending = window.Dequeue();
+                        var match = pending.Match;
+                        var percent = (i / (double)totalMatches) * 100.0;
+                        // Cached matches finish almost instantly, so per-match updates are rate-limited.
+                        if (ShouldReportProgress(i + 1, totalMatches, ref lastProgressReport))
                         {
                             progress.Report(new Lc0DownloadProgress(
                                 Lc0DownloadPhase.Downloading,
-                                $"Match {match.MatchId} failed: {outcome.Message}",
+                                $"Downloading match {match.MatchId} ({i + 1}/{totalMatches})...",
                                 i + 1,
                                 totalMatches,
                                 percent));
                         }
-                    }
 
-                    if (i < allMatches.Count - 1)
+                        try
+                        {
+                            var outcome = await pending.Task.ConfigureAwait(false);
+
+                            gamesSeen += outcome.GamesSeen;
+                            gamesKept += outcome.GamesKept;
+
+                            if (outcome.GamesKept > 0)
+                            {
+                                if (wroteGames)
+                                {
+                                    await writer.WriteLineAsync().ConfigureAwait(false);
+                                }
+
+                                await writer.FlushAsync().ConfigureAwait(false);
+                                await AppendFileAsync(pending.OutputPath, outputStream, ct).ConfigureAwait(false);
+                                wroteGames = true;
+                            }
+
+                            // The match's games are in the output now, so its cached download is no longer needed.
+                            TryDeleteFile(outcome.CachedFilePath);
+
+                            if (outcome.Success)
+                            {
+                                processedMatches++;
+                            }
+                            else
+                            {
+                                failedMatches++;
+                                if (!string.IsNullOrWhiteSpace(outcome.Message))
+                                {
+                                    progress.Report(new Lc0DownloadProgress(
+                                        Lc0DownloadPhase.Downloading,
+                                        $"Match {match.MatchId} failed: {outcome.Message}",
+                                        i + 1,
+                                        totalMatches,
+                                        percent));
+                                }
+                            }
+                        }
+                        finally
+                        {
+                            TryDeleteFile(pending.OutputPath);
+                        }
+                    }
+                }
+                finally
+                {
+                    if (window.Count > 0)
                     {
-                        var delayMs = Random.Shared.Next(200, 450);
-                        await Task.Delay(delayMs, ct).ConfigureAwait(false);
+                        windowCts.Cancel();
+                        while (window.TryDequeue(out var abandoned))
+                        {
+                            try
+                            {
+                                await abandoned.Task.ConfigureAwait(false);
+                            }
+                            catch (Exception ex)
+                            {
+                                Debug.WriteLine($"Abandoned Lc0 match {abandoned.Match.MatchId}: {ex.Message}");
+                            }
+
+                            TryDeleteFile(abandoned.OutputPath);
+                        }
                     }
                 }
 
@@ -215,6 +292,8 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
                     "Close any app using the destination file, then rename/move the preserved file manually.",
                     ex);
             }
+
+            ClearMatchCache(allMatches);
         }
         catch
         {
@@ -248,98 +327,106 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
         var failedPages = 0;
         var page = 1;
 
-        while (page <= MaxScrapePages)
-        {
-            ct.ThrowIfCancellationRequested();
+        // Keep one page in flight: the next page downloads while the current one is parsed.
+        using var prefetchCts = CancellationTokenSource.CreateLinkedTokenSource(ct);
+        Task<PageFetchResult>? pendingPage = FetchMatchesPageAsync(page, prefetchCts.Token);
 
-            progress.Report(new Lc0DownloadProgress(
-                Lc0DownloadPhase.Scraping,
-                $"Scraping page {page}...",
-                page,
-                null,
-                null));
-
-            var pageResult = await FetchMatchesPageAsync(page, progress, ct).ConfigureAwait(false);
-            if (pageResult.Status == PageFetchStatus.Failed)
+        try
+        {
+            while (page <= MaxScrapePages && pendingPage != null)
             {
-                failedPages++;
-                emptyPages = 0;
-                if (failedPages >= FailedPageLimit)
-                {
-                    break;
-                }
+                ct.ThrowIfCancellationRequested();
 
-                page++;
-                continue;
-            }
+                progress.Report(new Lc0DownloadProgress(
+                    Lc0DownloadPhase.Scraping,
+                    $"Scraping page {page}...",
+                    page,
+                    null,
+                    null));
 
-            failedPages = 0;
-            var pageMatches = pageResult.Matches;
-            if (pageMatches.Count == 0)
-            {
-                emptyPages++;
-                if (emptyPages >= EmptyPageLimit)
+                var pageResult = await pendingPage.ConfigureAwait(false);
+                pendingPage = page < MaxScrapePages
+                    ? FetchMatchesPageAsync(page + 1, prefetchCts.Token)
+                    : null;
+
+                if (pageResult.Status == PageFetchStatus.Failed)
                 {
-                    break;
-                }
+                    // Reported here rather than in the fetch, so a prefetched page that is
+                    // never consumed does not surface an error.
+                    progress.Report(new Lc0DownloadProgress(
+                        Lc0DownloadPhase.Scraping,
+                        $"Failed to fetch page {page}: {pageResult.ErrorMessage}"));
 
-                page++;
-                continue;
-            }
+                    failedPages++;
+                    emptyPages = 0;
+                    if (failedPages >= FailedPageLimit)
+                    {
+                        break;
+                    }
 
-            emptyPages = 0;
-            var filtered = FilterMatches(pageMatches, startDate, endDate);
-            foreach (var match in filtered)
-            {
-                if (seenMatchIds.Add(match.MatchId))
-                {
-                    matches.Add(match);
+                    page++;
+                    continue;
                 }
-            }
 
-            // Pages are newest to oldest; stop once we moved before the selected month.
-            if (pageMatches.All(m => m.Date.Date < startDate.Date))
-            {
-                break;
-            }
+                failedPages = 0;
+                var pageMatches = ParseMatchList(pageResult.Html);
+                if (pageMatches.Count == 0)
+                {
+                    emptyPages++;
+                    if (emptyPages >= EmptyPageLimit)
+                    {
+                        break;
+                    }
 
-            page++;
-        }
+                    page++;
+                    continue;
+                }
 
-        return matches;
-    }
+                emptyPages = 0;
+                var pageBeforeRange = true;
+                foreach (var match in pageMatches)
+                {
+                    var matchDate = match.Date.Date;
+                    if (matchDate < startDate.Date)
+                    {
+                        continue;
+                    }
 
-    private static List<Lc0MatchEntry> FilterMatches(
-        IEnumerable<Lc0MatchEntry> matches,
-        DateTime startDate,
-        DateTime endDate)
-    {
-        var filtered = new List<Lc0MatchEntry>();
+                    pageBeforeRange = false;
+                    if (matchDate <= endDate.Date && seenMatchIds.Add(match.MatchId))
+                    {
+                        matches.Add(match);
+                    }
+                }
 
-        foreach (var match in matches)
-        {
-            var matchDate = match.Date.Date;
+                // Pages are newest to oldest; stop once we moved before the selected month.
+                if (pageBeforeRange)
+                {
+                    break;
+                }
 
-            if (matchDate < startDate.Date)
-            {
-                continue;
+                page++;
             }
-
-            if (matchDate > endDate.Date)
+        }
+        finally
+        {
+            if (pendingPage != null)
             {
-                continue;
+                prefetchCts.Cancel();
+                try
+                {
+                    await pendingPage.ConfigureAwait(false);
+                }
+                catch (OperationCanceledException)
+                {
+                }
             }
-
-            filtered.Add(match);
         }
 
-        return filtered;
+        return matches;
     }
 
-    private async Task<PageFetchResult> FetchMatchesPageAsync(
-        int page,
-        IProgress<Lc0DownloadProgress> progress,
-        CancellationToken ct)
+    private async Task<PageFetchResult> FetchMatchesPageAsync(int page, CancellationToken ct)
     {
         var uri = new Uri($"{MatchesBaseUri}?page={page}&show_all=1");
         string? lastError = null;
@@ -350,13 +437,13 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
 
             try
             {
-                using var response = await HttpClient
+                using var response = await PageHttpClient
                     .GetAsync(uri, HttpCompletionOption.ResponseHeadersRead, ct)
                     .ConfigureAwait(false);
 
                 if (response.StatusCode == HttpStatusCode.NotFound)
                 {
-                    return PageFetchResult.Success([]);
+                    return PageFetchResult.Success(string.Empty);
                 }
 
                 if (!response.IsSuccessStatusCode)
@@ -372,7 +459,7 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
                 }
 
                 var html = await response.Content.ReadAsStringAsync(ct).ConfigureAwait(false);
-                return PageFetchResult.Success(ParseMatchList(html));
+                return PageFetchResult.Success(html);
             }
             catch (OperationCanceledException)
             {
@@ -390,9 +477,6 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
             }
         }
 
-        progress.Report(new Lc0DownloadProgress(
-            Lc0DownloadPhase.Scraping,
-            $"Failed to fetch page {page}: {lastError ?? "Unknown error"}"));
         return PageFetchResult.Failed(lastError ?? "Unknown error");
     }
 
@@ -413,10 +497,22 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
             return matches;
         }
 
+        // Walk each row's direct children instead of running a per-row XPath query;
+        // the cell list is reused across rows.
+        var cells = new List<HtmlNode>(8);
         foreach (var row in rows)
         {
-            var cells = row.SelectNodes("td");
-            if (cells == null || cells.Count < 2)
+            cells.Clear();
+            foreach (var child in row.ChildNodes)
+            {
+                if (child.NodeType == HtmlNodeType.Element &&
+                    child.Name.Equals("td", StringComparison.OrdinalIgnoreCase))
+                {
+                    cells.Add(child);
+                }
+            }
+
+            if (cells.Count < 2)
             {
                 continue;
             }
@@ -445,45 +541,144 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
         return matches;
     }
 
+    private PendingMatch StartMatch(
+        Lc0MatchEntry match,
+        IReadOnlySet<string> cachedFiles,
+        bool excludeNonStandard,
+        bool onlyCheckmates,
+        CancellationToken ct)
+    {
+        var outputPath = Path.Combine(Path.GetTempPath(), $"lc0_match_{Guid.NewGuid():N}.out.pgn");
+        var task = Task.Run(
+            () => DownloadMatchToFileAsync(match, outputPath, cachedFiles, excludeNonStandard, onlyCheckmates, ct),
+            ct);
+        return new PendingMatch(match, outputPath, task);
+    }
+
+    private async Task<Lc0DownloadOutcome> DownloadMatchToFileAsync(
+        Lc0MatchEntry match,
+        string outputPath,
+        IReadOnlySet<string> cachedFiles,
+        bool excludeNonStandard,
+        bool onlyCheckmates,
+        CancellationToken ct)
+    {
+        await using var stream = new FileStream(
+            outputPath,
+            FileMode.Create,
+            FileAccess.Write,
+            FileShare.None,
+            BufferSize,
+            FileOptions.Asynchronous);
+        await using var writer = new StreamWriter(stream, new UTF8Encoding(false), BufferSize);
+
+        var outcome = await DownloadAndProcessMatchAsync(
+            match,
+            cachedFiles,
+            new OutputWriter(writer),
+            excludeNonStandard,
+            onlyCheckmates,
+            ct).ConfigureAwait(false);
+
+        await writer.FlushAsync(ct).ConfigureAwait(false);
+        return outcome;
+    }
+
+    private static async Task AppendFileAsync(string sourcePath, Stream destination, CancellationToken ct)
+    {
+        await using var source = new FileStream(
+            sourcePath,
+            FileMode.Open,
+            FileAccess.Read,
+            FileShare.Read,
+            BufferSize,
+            FileOptions.SequentialScan | FileOptions.Asynchronous);
+        await source.CopyToAsync(destination, BufferSize, ct).ConfigureAwait(false);
+    }
+
     private async Task<Lc0DownloadOutcome> DownloadAndProcessMatchAsync(
         Lc0MatchEntry match,
+        IReadOnlySet<string> cachedFiles,
         OutputWriter outputWriter,
         bool excludeNonStandard,
         bool onlyCheckmates,
         CancellationToken ct)
     {
         string? lastError = null;
-
-        foreach (var candidate in BuildMatchUrls(match.TrainingRunId, match.MatchId))
+        var headers = Lc0MatchHeaders.Create(match);
+
+        var preferredPattern = Volatile.Read(ref _preferredUrlPattern);
+        var candidates = BuildMatchUrls(match.TrainingRunId, match.MatchId)
+            .Select(candidate => (
+                candidate.Url,
+                candidate.FileKind,
+                candidate.Pattern,
+                CacheFileName: GetCacheFileName(match.MatchId, candidate.Pattern, candidate.FileKind)))
+            .OrderBy(candidate => cachedFiles.Contains(candidate.CacheFileName) ? 0
+                : candidate.Pattern == preferredPattern ? 1
+                : 2);
+
+        foreach (var candidate in candidates)
         {
             ct.ThrowIfCancellationRequested();
 
-            var result = await DownloadToTempAsync(candidate.Url, candidate.FileKind, ct).ConfigureAwait(false);
+            var cachePath = Path.Combine(MatchCacheDirectory, candidate.CacheFileName);
+            string filePath;
 
-            if (result.Status == DownloadStatus.NotFound)
+            if (cachedFiles.Contains(candidate.CacheFileName) && IsUsableCachedFile(cachePath, candidate.FileKind))
             {
-                continue;
+                filePath = cachePath;
             }
-
-            if (result.Status != DownloadStatus.Success || string.IsNullOrWhiteSpace(result.TempPath))
+            else
             {
-                if (!string.IsNullOrWhiteSpace(result.Message))
+                var result = await DownloadToTempAsync(candidate.Url, candidate.FileKind, ct).ConfigureAwait(false);
+
+                if (result.Status == DownloadStatus.NotFound)
                 {
-                    lastError = $"{candidate.Url} -> {result.Message}";
+                    continue;
+                }
+
+                if (result.Status != DownloadStatus.Success || string.IsNullOrWhiteSpace(result.TempPath))
+                {
+                    if (!string.IsNullOrWhiteSpace(result.Message))
+                    {
+                        lastError = $"{candidate.Url} -> {result.Message}";
+                    }
+                    else
+                    {
+                        lastError = $"{candidate.Url} -> Download failed.";
+                    }
+
+                    // Every pattern is on the same storage host; once it keeps failing after
+                    // retries, probing the remaining patterns would only repeat the backoff.
+                    if (result.Status == DownloadStatus.Unavailable)
+                    {
+                        break;
+                    }
+
+                    continue;
                 }
-                else
+
+                // Error pages served with 200 are rejected here instead of failing inside the parser.
+                if (!HasExpectedSignature(result.TempPath, candidate.FileKind))
                 {
-                    lastError = $"{candidate.Url} -> Download failed.";
+                    lastError = $"{candidate.Url} -> Unexpected file content.";
+                    TryDeleteFile(result.TempPath);
+                    continue;
                 }
-                continue;
+
+                filePath = TryMoveToCache(result.TempPath, cachePath);
             }
 
+            // Only a file that produced games stays cached, and only until the main loop has
+            // appended the match; anything else is re-fetched next time.
+            var keepFile = false;
             try
             {
                 var processResult = await ProcessDownloadedFileAsync(
-                    result.TempPath,
+                    filePath,
                     candidate.FileKind,
-                    match,
+                    headers,
                     outputWriter,
                     excludeNonStandard,
                     onlyCheckmates,
@@ -491,17 +686,22 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
 
                 if (processResult.GamesSeen > 0)
                 {
+                    keepFile = filePath == cachePath;
+                    Volatile.Write(ref _preferredUrlPattern, candidate.Pattern);
                     return new Lc0DownloadOutcome(
                         true,
                         $"Kept {processResult.GamesKept:N0} game(s).",
                         processResult.GamesSeen,
-                        processResult.GamesKept);
+                        processResult.GamesKept,
+                        keepFile ? cachePath : null);
                 }
 
                 lastError = $"{candidate.Url} -> No PGN games found.";
             }
             catch (OperationCanceledException)
             {
+                // The download itself completed; keep it so the next run can resume from it.
+                keepFile = filePath == cachePath;
                 throw;
             }
             catch (Exception ex)
@@ -510,7 +710,10 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
             }
             finally
             {
-                TryDeleteFile(result.TempPath);
+                if (!keepFile)
+                {
+                    TryDeleteFile(filePath);
+                }
             }
         }
 
@@ -540,26 +743,45 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
 
                 if (response.IsSuccessStatusCode)
                 {
-                    await using var responseStream = await response.Content
+                    var expectedLength = response.Content.Headers.ContentLength;
+                    long writtenLength;
+
+                    await using (var responseStream = await response.Content
                         .ReadAsStreamAsync(ct)
-                        .ConfigureAwait(false);
-                    await using var fileStream = new FileStream(
-                        tempPath,
-                        FileMode.Create,
-                        FileAccess.Write,
-                        FileShare.None,
-                        BufferSize,
-                        FileOptions.Asynchronous);
-
-                    await responseStream.CopyToAsync(fileStream, ct).ConfigureAwait(false);
+                        .ConfigureAwait(false))
+                    await using (var fileStream = new FileStream(tempPath, new FileStreamOptions
+                    {
+                        Mode = FileMode.Create,
+                        Access = FileAccess.Write,
+                        Share = FileShare.None,
+                        BufferSize = BufferSize,
+                        Options = FileOptions.Asynchronous,
+                        PreallocationSize = expectedLength is > 0 ? expectedLength.Value : 0
+                    }))
+                    {
+                        await responseStream.CopyToAsync(fileStream, BufferSize, ct).ConfigureAwait(false);
+                        writtenLength = fileStream.Length;
+                    }
+
+                    if (expectedLength is > 0 && writtenLength != expectedLength.Value)
+                    {
+                        throw new IOException(
+                            $"Download truncated: received {writtenLength:N0} of {expectedLength.Value:N0} bytes.");
+                    }
+
                     return DownloadResult.Success(tempPath);
                 }
 
                 lastError = FormatStatus(response.StatusCode, response.ReasonPhrase);
-                if (IsRetryableStatusCode(response.StatusCode) && attempt < MaxRetries)
+                if (IsRetryableStatusCode(response.StatusCode))
                 {
-                    await Task.Delay(GetRetryDelay(attempt, response), ct).ConfigureAwait(false);
-                    continue;
+                    if (attempt < MaxRetries)
+                    {
+                        await Task.Delay(GetRetryDelay(attempt, response), ct).ConfigureAwait(false);
+                        continue;
+                    }
+
+                    return DownloadResult.Unavailable(lastError);
                 }
 
                 return DownloadResult.Failed(lastError ?? "Download failed.");
@@ -583,13 +805,13 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
         }
 
         TryDeleteFile(tempPath);
-        return DownloadResult.Failed(lastError ?? "Download failed.");
+        return DownloadResult.Unavailable(lastError ?? "Download failed.");
     }
 
     private async Task<Lc0ProcessingResult> ProcessDownloadedFileAsync(
         string filePath,
         Lc0FileKind fileKind,
-        Lc0MatchEntry match,
+        Lc0MatchHeaders headers,
         OutputWriter outputWriter,
         bool excludeNonStandard,
         bool onlyCheckmates,
@@ -608,9 +830,10 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
                 BufferSize,
                 FileOptions.SequentialScan | FileOptions.Asynchronous);
             await using var gzipStream = new GZipStream(fileStream, CompressionMode.Decompress);
-            using var tar = new TarReader(gzipStream);
+            await using var tar = new TarReader(gzipStream);
 
-            while (tar.GetNextEntry() is { } entry)
+            // Single forward pass over the archive; entry data is streamed, not copied.
+            while (await tar.GetNextEntryAsync(copyData: false, ct).ConfigureAwait(false) is { } entry)
             {
                 ct.ThrowIfCancellationRequested();
 
@@ -627,7 +850,7 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
                 // Do not dispose entry.DataStream: TarReader expects sequential consumption.
                 var result = await ProcessPgnStreamAsync(
                     entry.DataStream,
-                    match,
+                    headers,
                     outputWriter,
                     excludeNonStandard,
                     onlyCheckmates,
@@ -648,7 +871,7 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
 
             var result = await ProcessPgnStreamAsync(
                 pgnStream,
-                match,
+                headers,
                 outputWriter,
                 excludeNonStandard,
                 onlyCheckmates,
@@ -662,7 +885,7 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
 
     private async Task<Lc0ProcessingResult> ProcessPgnStreamAsync(
         Stream stream,
-        Lc0MatchEntry match,
+        Lc0MatchHeaders headers,
         OutputWriter outputWriter,
         bool excludeNonStandard,
         bool onlyCheckmates,
@@ -681,7 +904,7 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
                 continue;
             }
 
-            UpdateHeaders(game, match);
+            UpdateHeaders(game, headers);
 
             if (outputWriter.NeedsSeparator)
             {
@@ -745,36 +968,42 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
         return !string.IsNullOrWhiteSpace(game.MoveText) && game.MoveText.Contains('#');
     }
 
-    private static void UpdateHeaders(PgnGame game, Lc0MatchEntry match)
+    private static void UpdateHeaders(PgnGame game, Lc0MatchHeaders headers)
     {
-        var dateOnly = DateOnly.FromDateTime(match.Date.UtcDateTime);
-        var dateString = dateOnly.ToString("yyyy-MM-dd", CultureInfo.InvariantCulture);
-        var version = GetVersion(dateOnly);
-
-        game.Headers["Event"] = $"Lc0 match {match.MatchId}";
-        game.Headers["Date"] = dateString;
-        game.Headers["White"] = $"Lc0 {version}";
-        game.Headers["Black"] = $"Lc0 {version}";
+        game.Headers["Event"] = headers.Event;
+        game.Headers["Date"] = headers.Date;
+        game.Headers["White"] = headers.Player;
+        game.Headers["Black"] = headers.Player;
     }
 
     private static string GetVersion(DateOnly date)
     {
-        foreach (var cutoff in VersionMap.Value)
+        // Cutoffs are sorted newest first; binary-search for the first one starting on or before the date.
+        var cutoffs = VersionMap.Value;
+        var low = 0;
+        var high = cutoffs.Count;
+        while (low < high)
         {
-            if (date >= cutoff.Start)
+            var mid = low + ((high - low) / 2);
+            if (date >= cutoffs[mid].Start)
+            {
+                high = mid;
+            }
+            else
             {
-                return cutoff.Version;
+                low = mid + 1;
             }
         }
 
-        return "v0.23.0";
+        return low < cutoffs.Count ? cutoffs[low].Version : "v0.23.0";
     }
 
-    private static IReadOnlyList<(Uri Url, Lc0FileKind FileKind)> BuildMatchUrls(int trainingRunId, int matchId)
+    private static IReadOnlyList<(Uri Url, Lc0FileKind FileKind, int Pattern)> BuildMatchUrls(int trainingRunId, int matchId)
     {
+        // Pattern numbers are stable whether or not the run segment is available.
         var runSegments = trainingRunId > 0
-            ? new[] { $"{trainingRunId}/", string.Empty }
-            : [string.Empty];
+            ? new[] { (Segment: $"{trainingRunId}/", Index: 0), (Segment: string.Empty, Index: 1) }
+            : [(Segment: string.Empty, Index: 1)];
 
         var baseNames = new[]
         {
@@ -788,14 +1017,16 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
             (Suffix: ".pgn.tar.gz", Kind: Lc0FileKind.TarGz)
         };
 
-        var urls = new List<(Uri Url, Lc0FileKind FileKind)>(runSegments.Length * baseNames.Length * suffixes.Length);
-        foreach (var runSegment in runSegments)
+        var urls = new List<(Uri Url, Lc0FileKind FileKind, int Pattern)>(runSegments.Length * baseNames.Length * suffixes.Length);
+        foreach (var (runSegment, runIndex) in runSegments)
         {
-            foreach (var baseName in baseNames)
+            for (var baseIndex = 0; baseIndex < baseNames.Length; baseIndex++)
             {
-                foreach (var (suffix, kind) in suffixes)
+                for (var suffixIndex = 0; suffixIndex < suffixes.Length; suffixIndex++)
                 {
-                    urls.Add((new Uri(StorageBaseUri, $"{runSegment}{baseName}{suffix}"), kind));
+                    var (suffix, kind) = suffixes[suffixIndex];
+                    var pattern = (((runIndex * baseNames.Length) + baseIndex) * suffixes.Length) + suffixIndex;
+                    urls.Add((new Uri(StorageBaseUri, $"{runSegment}{baseNames[baseIndex]}{suffix}"), kind, pattern));
                 }
             }
         }
@@ -920,9 +1151,19 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
         return File.Exists(secondary) ? secondary : null;
     }
 
-    private static HttpClient CreateClient()
+    private static HttpClient CreateClient(DecompressionMethods decompression)
     {
-        var client = new HttpClient
+        // Pooled handler so keep-alive connections (and their TLS sessions) are reused across requests.
+        var handler = new SocketsHttpHandler
+        {
+            AutomaticDecompression = decompression,
+            MaxConnectionsPerServer = 8,
+            PooledConnectionIdleTimeout = TimeSpan.FromSeconds(75),
+            // Recycle pooled connections periodically so DNS changes are picked up.
+            PooledConnectionLifetime = TimeSpan.FromMinutes(5)
+        };
+
+        var client = new HttpClient(handler)
         {
             // Rely on caller-provided CancellationToken for long downloads.
             Timeout = Timeout.InfiniteTimeSpan
@@ -932,6 +1173,132 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
         return client;
     }
 
+    private static HashSet<string> LoadMatchCache()
+    {
+        var cachedFiles = new HashSet<string>(StringComparer.OrdinalIgnoreCase);
+
+        try
+        {
+            Directory.CreateDirectory(MatchCacheDirectory);
+            var cutoff = DateTime.UtcNow - MatchCacheMaxAge;
+
+            foreach (var file in new DirectoryInfo(MatchCacheDirectory).EnumerateFiles())
+            {
+                if (file.LastWriteTimeUtc < cutoff || file.Length == 0)
+                {
+                    TryDeleteFile(file.FullName);
+                    continue;
+                }
+
+                cachedFiles.Add(file.Name);
+            }
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            Debug.WriteLine($"Failed to read Lc0 match cache: {ex.Message}");
+        }
+
+        return cachedFiles;
+    }
+
+    private static void ClearMatchCache(IEnumerable<Lc0MatchEntry> matches)
+    {
+        var matchIds = matches
+            .Select(match => match.MatchId.ToString(CultureInfo.InvariantCulture))
+            .ToHashSet(StringComparer.Ordinal);
+
+        try
+        {
+            foreach (var path in Directory.EnumerateFiles(MatchCacheDirectory))
+            {
+                var name = Path.GetFileName(path);
+                var separator = name.IndexOf('-');
+                if (separator > 0 && matchIds.Contains(name[..separator]))
+                {
+                    TryDeleteFile(path);
+                }
+            }
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            Debug.WriteLine($"Failed to clear Lc0 match cache: {ex.Message}");
+        }
+    }
+
+    private static string GetCacheFileName(int matchId, int pattern, Lc0FileKind fileKind)
+    {
+        var extension = fileKind == Lc0FileKind.TarGz ? ".pgn.tar.gz" : ".pgn";
+        return $"{matchId.ToString(CultureInfo.InvariantCulture)}-{pattern.ToString(CultureInfo.InvariantCulture)}{extension}";
+    }
+
+    private static bool IsUsableCachedFile(string path, Lc0FileKind fileKind)
+    {
+        try
+        {
+            return new FileInfo(path) is { Exists: true, Length: > 0 } && HasExpectedSignature(path, fileKind);
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            return false;
+        }
+    }
+
+    // Checks only the first block of the file: the gzip magic for archives, or a leading
+    // tag pair for plain PGN. Nothing is decompressed.
+    private static bool HasExpectedSignature(string path, Lc0FileKind fileKind)
+    {
+        Span<byte> header = stackalloc byte[512];
+        int read;
+
+        try
+        {
+            using var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.Read, bufferSize: 1);
+            read = stream.ReadAtLeast(header, header.Length, throwOnEndOfStream: false);
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            return false;
+        }
+
+        header = header[..read];
+        if (fileKind == Lc0FileKind.TarGz)
+        {
+            return header.Length >= 2 && header[0] == 0x1F && header[1] == 0x8B;
+        }
+
+        if (header.StartsWith("\uFEFF"u8))
+        {
+            header = header[3..];
+        }
+
+        foreach (var b in header)
+        {
+            if (b is (byte)' ' or (byte)'\t' or (byte)'\r' or (byte)'\n')
+            {
+                continue;
+            }
+
+            return b == (byte)'[';
+        }
+
+        return false;
+    }
+
+    private static string TryMoveToCache(string tempPath, string cachePath)
+    {
+        try
+        {
+            Directory.CreateDirectory(MatchCacheDirectory);
+            File.Move(tempPath, cachePath, overwrite: true);
+            return cachePath;
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+        {
+            Debug.WriteLine($"Failed to cache Lc0 match file '{cachePath}': {ex.Message}");
+            return tempPath;
+        }
+    }
+
     private static void TryDeleteFile(string? path)
     {
         if (string.IsNullOrWhiteSpace(path))
@@ -952,6 +1319,18 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
         }
     }
 
+    private static bool ShouldReportProgress(int current, int total, ref DateTime lastReportUtc)
+    {
+        var now = DateTime.UtcNow;
+        if (current > 1 && current < total && now - lastReportUtc < ProgressTimeInterval)
+        {
+            return false;
+        }
+
+        lastReportUtc = now;
+        return true;
+    }
+
     private static bool IsRetryableStatusCode(HttpStatusCode statusCode) =>
         statusCode is HttpStatusCode.RequestTimeout
             or HttpStatusCode.TooManyRequests
@@ -977,8 +1356,9 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
             }
         }
 
-        var baseDelay = TimeSpan.FromSeconds(2 * attempt);
-        var jitter = TimeSpan.FromMilliseconds(Random.Shared.Next(200, 450));
+        // Exponential backoff (4s, 8s, ...) with jitter so concurrent retries spread out.
+        var baseDelay = TimeSpan.FromSeconds(4 << Math.Min(attempt - 1, 4));
+        var jitter = TimeSpan.FromMilliseconds(Random.Shared.Next(0, 1000));
         return baseDelay + jitter;
     }
 
@@ -996,19 +1376,32 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
 
     private sealed record Lc0MatchEntry(int MatchId, int TrainingRunId, DateTimeOffset Date);
 
+    // Header values shared by every game in a match, formatted once per match.
+    private sealed record Lc0MatchHeaders(string Event, string Date, string Player)
+    {
+        public static Lc0MatchHeaders Create(Lc0MatchEntry match)
+        {
+            var dateOnly = DateOnly.FromDateTime(match.Date.UtcDateTime);
+            return new Lc0MatchHeaders(
+                $"Lc0 match {match.MatchId}",
+                dateOnly.ToString("yyyy-MM-dd", CultureInfo.InvariantCulture),
+                $"Lc0 {GetVersion(dateOnly)}");
+        }
+    }
+
     private sealed record VersionCutoff(DateOnly Start, string Version);
 
     private sealed record VersionMapConfig(List<VersionMapEntry>? VersionMap);
 
     private sealed record VersionMapEntry(string? Start, string? Version);
 
-    private sealed record PageFetchResult(PageFetchStatus Status, List<Lc0MatchEntry> Matches, string? ErrorMessage)
+    private sealed record PageFetchResult(PageFetchStatus Status, string Html, string? ErrorMessage)
     {
-        public static PageFetchResult Success(List<Lc0MatchEntry> matches) =>
-            new(PageFetchStatus.Success, matches, null);
+        public static PageFetchResult Success(string html) =>
+            new(PageFetchStatus.Success, html, null);
 
         public static PageFetchResult Failed(string message) =>
-            new(PageFetchStatus.Failed, [], message);
+            new(PageFetchStatus.Failed, string.Empty, message);
     }
 
     private enum PageFetchStatus
@@ -1022,19 +1415,28 @@ public sealed partial class Lc0DownloaderService : ILc0DownloaderService
         public static DownloadResult Success(string path) => new(DownloadStatus.Success, path, null);
         public static DownloadResult NotFound() => new(DownloadStatus.NotFound, null, null);
         public static DownloadResult Failed(string message) => new(DownloadStatus.Failed, null, message);
+        public static DownloadResult Unavailable(string message) => new(DownloadStatus.Unavailable, null, message);
     }
 
     private enum DownloadStatus
     {
         Success,
         NotFound,
-        Failed
+        Failed,
+        Unavailable
     }
 
-    private sealed record Lc0DownloadOutcome(bool Success, string Message, long GamesSeen, long GamesKept);
+    private sealed record Lc0DownloadOutcome(
+        bool Success,
+        string Message,
+        long GamesSeen,
+        long GamesKept,
+        string? CachedFilePath = null);
 
     private sealed record Lc0ProcessingResult(long GamesSeen, long GamesKept);
 
+    private sealed record PendingMatch(Lc0MatchEntry Match, string OutputPath, Task<Lc0DownloadOutcome> Task);
+
     private sealed class OutputWriter
     {
         public OutputWriter(StreamWriter writer)
@@ -1,4 +1,5 @@
 using System.Buffers;
+using System.Collections.Frozen;
 using System.IO;
 using System.Runtime.CompilerServices;
 using System.Text;
@@ -554,7 +555,7 @@ public partial class PgnReader
 
             if (quoteEndedAt < 0) return false;
 
-            key = nameSpan.ToString();
+            key = GetTagName(nameSpan);
             rawValue = builder.ToString();
 
             var closingIdx = span.IndexOf(']');
@@ -570,7 +571,7 @@ public partial class PgnReader
         var closingIndex = span.IndexOf(']');
         if (closingIndex < 0) return false;
 
-        key = nameSpan.ToString();
+        key = GetTagName(nameSpan);
         rawValue = span[..closingIndex].ToString().TrimEnd();
 
         var trailing = span[(closingIndex + 1)..].Trim();
@@ -579,5 +580,20 @@ public partial class PgnReader
         return true;
     }
 
+    private static string GetTagName(ReadOnlySpan<char> name) =>
+        KnownTagNames.TryGetValue(name, out var known) ? known : name.ToString();
+
     private static readonly char[] LineBreak = ['\n'];
+
+    // Common tag names resolve to shared string instances instead of allocating a new key per header line.
+    private static readonly FrozenSet<string>.AlternateLookup<ReadOnlySpan<char>> KnownTagNames =
+        new[]
+        {
+            "Event", "Site", "Date", "Round", "White", "Black", "Result",
+            "WhiteElo", "BlackElo", "WhiteTitle", "BlackTitle", "WhiteFideId", "BlackFideId",
+            "ECO", "Opening", "Variation", "EventDate", "TimeControl", "Termination",
+            "PlyCount", "Annotator", "SetUp", "FEN", "Variant", "UTCDate", "UTCTime"
+        }
+        .ToFrozenSet(StringComparer.Ordinal)
+        .GetAlternateLookup<ReadOnlySpan<char>>();
 }